@@ -2,23 +2,92 @@
 """Chrome scraper service that connects to Chrome via DevTools protocol."""
 
 import asyncio
+import contextlib
+import multiprocessing
 import os
 import signal
 import socket
 import subprocess
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 
-import trafilatura
+import orjson
 from aiohttp import web
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 
 from scrape_to_md.config import get_config
+from scrape_to_md.extraction import extract_markdown
 from scrape_to_md.logging_config import setup_logging
+from scrape_to_md.protocol import encode_frame, read_frame
+from scrape_to_md.readiness import wait_for_exit, wait_until_ready
 
 
 # Logger will be initialized in main()
 logger = None
 
+# Scraping context is replaced after this many pages or seconds, whichever
+# comes first, so Playwright's per-context object tracking can't grow unbounded
+ROTATE_CONTEXT_EVERY_PAGES = 50
+ROTATE_CONTEXT_EVERY_SECONDS = 900
+
+# Longest wait for network idle after DOMContentLoaded (the old fixed delay)
+NETWORK_IDLE_TIMEOUT_MS = 2000
+
+# Timeout for a reconnect-only attempt before falling back to a Chrome restart
+RECONNECT_TIMEOUT_MS = 2000
+
+# Images, media, fonts and stylesheets aren't needed to extract text; the HTML
+# keeps their URLs, so image links still appear in the markdown
+BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in (
+        "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+        "woff", "woff2", "ttf", "otf",
+        "mp4", "webm", "mp3", "m4a", "ogg",
+        "css",
+    )
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+]
+
+# Chrome flags that cut memory use, enabled by the daemon.chrome_low_memory
+# config option. Off by default: this is a visible browser the user may also
+# browse in, and these flags disable GPU rendering and limit renderer processes
+LOW_MEMORY_CHROME_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-accelerated-2d-canvas",
+    "--disable-mipmap-generation",
+    "--disable-partial-raster",
+    "--disable-webgl",
+    "--renderer-process-limit=2",
+    "--js-flags=--max-old-space-size=512",
+]
+
+# Idle pages kept open for reuse instead of creating one per request
+MAX_POOLED_PAGES = 4
+
+# Trafilatura extraction is CPU-bound; it runs in this many worker processes
+# (created on first use) so it doesn't block the event loop
+MAX_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Returns the page (or the element matching the selector argument, wrapped in a
+# document so trafilatura can process it) with non-content elements removed, so
+# they are neither sent over CDP nor parsed by lxml
+STRIPPED_HTML_JS = """
+(selector) => {
+    const found = selector ? document.querySelector(selector) : null;
+    const root = (found || document.documentElement).cloneNode(true);
+    root.querySelectorAll(
+        'script, style, noscript, svg, iframe, link[rel="stylesheet"]'
+    ).forEach((el) => el.remove());
+    return found
+        ? `<html><body><article>${root.innerHTML}</article></body></html>`
+        : root.outerHTML;
+}
+"""
+
 
 def is_chrome_running(port: int = 9222) -> bool:
     """Check if Chrome's remote debugging port is accessible.
@@ -36,13 +105,16 @@ def is_chrome_running(port: int = 9222) -> bool:
         return False
 
 
-def launch_chrome(port: int, profile_dir: Path, chrome_path: str) -> subprocess.Popen:
+def launch_chrome(
+    port: int, profile_dir: Path, chrome_path: str, low_memory: bool = False
+) -> subprocess.Popen:
     """Launch Chrome with remote debugging enabled.
 
     Args:
         port: CDP port number
         profile_dir: User data directory for Chrome profile
         chrome_path: Path to Chrome executable
+        low_memory: Add LOW_MEMORY_CHROME_ARGS to the command line
 
     Returns:
         Chrome process
@@ -56,6 +128,8 @@ def launch_chrome(port: int, profile_dir: Path, chrome_path: str) -> subprocess.
         "--no-first-run",
         "--no-default-browser-check",
     ]
+    if low_memory:
+        cmd.extend(LOW_MEMORY_CHROME_ARGS)
 
     logger.info(f"Launching Chrome with profile: {profile_dir}")
     # Start Chrome as a detached process
@@ -71,20 +145,40 @@ def launch_chrome(port: int, profile_dir: Path, chrome_path: str) -> subprocess.
 class ChromeService:
     """Chrome scraper service using Playwright."""
 
-    def __init__(self):
-        """Initialize scraper service."""
+    def __init__(self, extractor: Executor | None = None):
+        """Initialize scraper service.
+
+        Args:
+            extractor: Executor for trafilatura extraction (defaults to the
+                event loop's thread pool)
+        """
+        self.extractor = extractor
         self.config = get_config()
         self.cdp_url = f"http://localhost:{self.config.cdp_port}"
         self.playwright = None
         self.browser = None
         self.chrome_process = None
+        self._chrome_pidfd = None
         self.chrome_pid_file = self.config.pids_dir / "chrome_browser.pid"
+        self._ctx = None
+        self._ctx_started = 0.0
+        self._pages_served = 0
+        self._retired_contexts = []
+        self._ctx_lock = asyncio.Lock()
+        self.page_pool = asyncio.Queue(maxsize=MAX_POOLED_PAGES)
 
     async def start(self):
-        """Connect to existing Chrome instance, launching one if needed."""
-        await self._ensure_chrome_running()
+        """Connect to existing Chrome instance, launching one if needed.
 
-        self.playwright = await async_playwright().start()
+        Chrome startup and the Playwright driver spawn are independent, so they
+        run concurrently. An already-running Playwright instance is reused.
+        """
+        chrome_ready = asyncio.create_task(self._ensure_chrome_running())
+        try:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+        finally:
+            await chrome_ready
 
         # Try to connect to Chrome via CDP with retry logic
         max_retries = 3
@@ -121,7 +215,8 @@ class ChromeService:
             self.chrome_process = launch_chrome(
                 self.config.cdp_port,
                 self.config.chrome_profile,
-                chrome_path
+                chrome_path,
+                low_memory=self.config.chrome_low_memory,
             )
 
             # Save Chrome browser PID
@@ -129,43 +224,122 @@ class ChromeService:
             self.chrome_pid_file.write_text(str(self.chrome_process.pid))
             logger.info(f"Chrome browser PID: {self.chrome_process.pid}")
 
-            # Wait for Chrome to be ready
-            for _ in range(30):  # 30 second timeout
-                await asyncio.sleep(1)
-                if is_chrome_running(self.config.cdp_port):
-                    logger.info("Chrome is ready")
-                    break
-            else:
+            # Hold a pidfd so shutdown signals this exact process, not a reused PID
+            if hasattr(os, "pidfd_open"):
+                try:
+                    self._chrome_pidfd = os.pidfd_open(self.chrome_process.pid)
+                except OSError as e:
+                    logger.warning(f"Could not open pidfd for Chrome: {e}")
+
+            # Wait for Chrome to accept CDP connections, failing fast if it exits
+            port = self.config.cdp_port
+            if not await wait_until_ready(
+                lambda: asyncio.open_connection("127.0.0.1", port),
+                self.chrome_process.pid,
+                timeout=30,
+            ):
                 raise RuntimeError("Chrome failed to start within 30 seconds")
+            logger.info("Chrome is ready")
+
+    async def _disconnect_browser(self):
+        """Close the CDP browser connection, keeping Playwright running."""
+        # Scraping contexts belong to the browser connection and close with it
+        self._ctx = None
+        self._retired_contexts = []
+        self.page_pool = asyncio.Queue(maxsize=MAX_POOLED_PAGES)
 
-    async def stop(self):
-        """Stop scraper and cleanup."""
         if self.browser:
             try:
                 await self.browser.close()
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
+            self.browser = None
+
+    async def stop(self):
+        """Stop scraper and cleanup."""
+        await self._disconnect_browser()
 
         if self.playwright:
             try:
                 await self.playwright.stop()
             except Exception as e:
                 logger.warning(f"Error stopping playwright: {e}")
+            self.playwright = None
 
         # Kill Chrome browser if we started it
         await self.cleanup_chrome()
 
     async def cleanup_chrome(self):
         """Kill Chrome browser process on shutdown."""
+        if self._chrome_pidfd is not None:
+            await self._terminate_chrome_pidfd()
+            return
+
+        # No pidfd (non-Linux, or Chrome launched by an earlier daemon): fall
+        # back to the PID file
         if self.chrome_pid_file.exists():
             try:
                 pid = int(self.chrome_pid_file.read_text())
-                import os
                 os.kill(pid, signal.SIGTERM)
                 logger.info(f"Stopped Chrome browser (PID {pid})")
-                self.chrome_pid_file.unlink()
+            except ProcessLookupError:
+                logger.info("Chrome already exited, removing stale PID file")
             except Exception as e:
                 logger.warning(f"Failed to cleanup Chrome: {e}")
+                return
+            self.chrome_pid_file.unlink(missing_ok=True)
+
+    async def _terminate_chrome_pidfd(self):
+        """Terminate the Chrome process we launched and wait for it to exit."""
+        pidfd = self._chrome_pidfd
+        pid = self.chrome_process.pid
+        self._chrome_pidfd = None
+
+        try:
+            signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            if not await wait_for_exit(pidfd, timeout=10):
+                logger.warning(f"Chrome (PID {pid}) ignored SIGTERM, killing")
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                await wait_for_exit(pidfd, timeout=5)
+            logger.info(f"Stopped Chrome browser (PID {pid})")
+        except ProcessLookupError:
+            logger.info(f"Chrome (PID {pid}) already exited")
+        except Exception as e:
+            logger.warning(f"Failed to cleanup Chrome: {e}")
+
+        # Reap the child so it doesn't linger as a zombie
+        try:
+            os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+        except ChildProcessError:
+            pass
+        finally:
+            os.close(pidfd)
+            self.chrome_process = None
+            self.chrome_pid_file.unlink(missing_ok=True)
+
+    async def _reconnect_browser(self) -> bool:
+        """Reconnect to the running Chrome over CDP without relaunching it.
+
+        Returns:
+            True if reconnected to a browser with at least one context
+        """
+        if self.playwright is None or not is_chrome_running(self.config.cdp_port):
+            return False
+
+        try:
+            self.browser = await self.playwright.chromium.connect_over_cdp(
+                self.cdp_url, timeout=RECONNECT_TIMEOUT_MS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to reconnect to Chrome: {e}")
+            return False
+
+        if not self.browser.contexts:
+            await self._disconnect_browser()
+            return False
+
+        logger.info(f"Reconnected to browser at {self.cdp_url}")
+        return True
 
     async def ensure_connected(self):
         """Ensure we have a valid browser connection with at least one context."""
@@ -185,8 +359,14 @@ class ChromeService:
 
         if needs_reconnect:
             logger.info("Browser disconnected or no contexts, reconnecting...")
-            await self.stop()
-            await self.start()
+            await self._disconnect_browser()
+
+            # Usually only the CDP WebSocket dropped; relaunch Chrome only if a
+            # plain reconnect doesn't get us a usable browser
+            if not await self._reconnect_browser():
+                logger.info("Reconnect failed, restarting Chrome...")
+                await self.cleanup_chrome()
+                await self.start()
 
             # If still no contexts after reconnect, we need to wait for a window
             if not self.browser.contexts:
@@ -194,6 +374,102 @@ class ChromeService:
                     "No browser windows available. Open a Chrome window and try again."
                 )
 
+    async def _new_context(self):
+        """Create a scraping context seeded with the profile's logged-in session.
+
+        Cookies and local storage are copied from the default (persistent
+        profile) context, so logins made in the visible Chrome window are
+        picked up on every rotation.
+        """
+        state = await self.browser.contexts[0].storage_state()
+        self._ctx = await self.browser.new_context(storage_state=state)
+        self._ctx_started = time.monotonic()
+        self._pages_served = 0
+        logger.info("Created new scraping context")
+        return self._ctx
+
+    async def _acquire_context(self):
+        """Get the current scraping context, creating it if needed."""
+        async with self._ctx_lock:
+            if self._ctx is None:
+                await self._new_context()
+            return self._ctx
+
+    async def _release_context(self, context):
+        """Count a finished page and rotate the context once it is due.
+
+        The old context is closed once its last in-flight page is closed.
+        """
+        async with self._ctx_lock:
+            if context is self._ctx:
+                self._pages_served += 1
+                if (
+                    self._pages_served >= ROTATE_CONTEXT_EVERY_PAGES
+                    or time.monotonic() - self._ctx_started > ROTATE_CONTEXT_EVERY_SECONDS
+                ):
+                    self._retired_contexts.append(self._ctx)
+                    await self._drain_page_pool()
+                    await self._new_context()
+
+            for retired in list(self._retired_contexts):
+                if retired.pages:
+                    continue
+                self._retired_contexts.remove(retired)
+                try:
+                    await retired.close()
+                except Exception as e:
+                    logger.warning(f"Error closing retired context: {e}")
+
+    async def _acquire_page(self, context):
+        """Take a warm page for context from the pool, or open a new one."""
+        while not self.page_pool.empty():
+            page = self.page_pool.get_nowait()
+            if page.context is context and not page.is_closed():
+                return page
+            await self._close_page(page)
+        return await self._new_page(context)
+
+    async def _new_page(self, context):
+        """Open a page that skips downloading resources extraction never uses.
+
+        Blocking goes through CDP rather than page.route(), which leaks memory
+        in long-lived contexts. The CDP session stays attached for the page's
+        lifetime so the block list survives pooling.
+        """
+        page = await context.new_page()
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block resource loading: {e}")
+        return page
+
+    async def _release_page(self, page):
+        """Reset a page and return it to the pool, closing it if the pool is full."""
+        if page.context is self._ctx and not page.is_closed() and not self.page_pool.full():
+            try:
+                await page.goto("about:blank")
+            except Exception as e:
+                logger.warning(f"Error resetting pooled page: {e}")
+            else:
+                if page.context is self._ctx and not self.page_pool.full():
+                    self.page_pool.put_nowait(page)
+                    return
+        await self._close_page(page)
+
+    async def _drain_page_pool(self):
+        """Close all pooled pages (before their context is retired)."""
+        while not self.page_pool.empty():
+            await self._close_page(self.page_pool.get_nowait())
+
+    async def _close_page(self, page):
+        """Close a page, logging instead of raising on failure."""
+        try:
+            await page.close()
+        except Exception as e:
+            logger.warning(f"Error closing page: {e}")
+
     async def scrape(self, url: str, selector: str = None) -> dict:
         """Scrape a URL.
 
@@ -206,35 +482,25 @@ class ChromeService:
         """
         await self.ensure_connected()
 
-        # Get the default context (logged-in session)
-        context = self.browser.contexts[0]
-        page = await context.new_page()
+        # Get the scraping context (copy of the logged-in session)
+        context = await self._acquire_context()
+        page = await self._acquire_page(context)
 
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(2)
+
+            # Give client-side rendering until the network goes quiet, capped so
+            # pages with constant background traffic still proceed
+            with contextlib.suppress(PlaywrightTimeoutError):
+                await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
 
             title = await page.title()
 
-            if selector:
-                element = await page.query_selector(selector)
-                if element:
-                    inner = await element.inner_html()
-                    # Wrap in a document so trafilatura can process it
-                    html = f"<html><body><article>{inner}</article></body></html>"
-                else:
-                    html = await page.content()
-            else:
-                html = await page.content()
-
-            markdown = (
-                trafilatura.extract(
-                    html,
-                    include_links=True,
-                    include_images=True,
-                    output_format="markdown",
-                )
-                or ""
+            # Serialize only the content trafilatura can use, in a single round trip
+            html = await page.evaluate(STRIPPED_HTML_JS, selector)
+
+            markdown = await asyncio.get_running_loop().run_in_executor(
+                self.extractor, extract_markdown, html
             )
 
             return {"url": url, "title": title, "markdown": markdown, "error": None}
@@ -243,18 +509,51 @@ class ChromeService:
             logger.error(f"Scraping error for {url}: {e}")
             return {"url": url, "title": "", "markdown": "", "error": str(e)}
         finally:
-            await page.close()
+            await self._release_page(page)
+            await self._release_context(context)
 
 
 # Global scraper instance
 scraper = None
 
 
+async def handle_scrape_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+):
+    """Serve framed scrape requests on one client connection until it closes.
+
+    Scrape failures are answered with an error frame so the client doesn't
+    mistake them for a dead connection and resend; only framing or decoding
+    errors drop the connection.
+    """
+    try:
+        while True:
+            try:
+                request = await read_frame(reader)
+            except asyncio.IncompleteReadError:
+                break  # Client closed the connection
+            url = request["url"]
+            try:
+                result = await scraper.scrape(url, request.get("selector"))
+            except Exception as e:
+                logger.error(f"Scraping error for {url}: {e}")
+                result = {"url": url, "title": "", "markdown": "", "error": str(e)}
+            writer.write(encode_frame(result))
+            await writer.drain()
+    except Exception as e:
+        logger.error(f"Scrape connection error: {e}")
+    finally:
+        writer.close()
+
+
 async def handle_scrape(request: web.Request) -> web.Response:
-    """Handle scrape requests."""
-    data = await request.json()
+    """Handle JSON scrape requests over HTTP.
+
+    The CLI uses the framed socket; this endpoint remains for HTTP clients.
+    """
+    data = orjson.loads(await request.read())
     result = await scraper.scrape(data["url"], data.get("selector"))
-    return web.json_response(result)
+    return web.Response(body=orjson.dumps(result), content_type="application/json")
 
 
 async def handle_health(request: web.Request) -> web.Response:
@@ -265,15 +564,35 @@ async def handle_health(request: web.Request) -> web.Response:
 async def on_startup(app: web.Application):
     """Startup handler."""
     global scraper
-    scraper = ChromeService()
+
+    # Spawned workers import only what the extraction function needs, not the
+    # forked state of the daemon
+    app["extractor"] = ProcessPoolExecutor(
+        max_workers=MAX_EXTRACT_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+    scraper = ChromeService(app["extractor"])
     await scraper.start()
+
+    # Framed scrape socket comes up before the HTTP socket clients probe
+    config = get_config()
+    config.scrape_socket_path.unlink(missing_ok=True)
+    app["scrape_server"] = await asyncio.start_unix_server(
+        handle_scrape_connection, path=str(config.scrape_socket_path)
+    )
     logger.info("Chrome scraper service started")
 
 
 async def on_cleanup(app: web.Application):
     """Cleanup handler."""
+    if "scrape_server" in app:
+        app["scrape_server"].close()
+        await app["scrape_server"].wait_closed()
+        get_config().scrape_socket_path.unlink(missing_ok=True)
+
     if scraper:
         await scraper.stop()
+    if "extractor" in app:
+        app["extractor"].shutdown(cancel_futures=True)
     logger.info("Chrome scraper service stopped")
 
 
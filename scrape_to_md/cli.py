@@ -3,19 +3,64 @@
 import argparse
 import asyncio
 import os
+import select
 import signal
 import subprocess
 import sys
-import time
 from pathlib import Path
 
 from scrape_to_md.config import get_config
-from scrape_to_md.daemon_client import is_daemon_running, scrape_via_daemon
+from scrape_to_md.daemon_client import close_connections, is_daemon_running, scrape_via_daemon
 from scrape_to_md.detector import detect_url_type
-from scrape_to_md.pdf import scrape_pdf
-from scrape_to_md.web import scrape_web
+from scrape_to_md.readiness import wait_until_ready
+from scrape_to_md.web import scrape_web, shutdown_browser
 from scrape_to_md.youtube import scrape_youtube
 
+# Upper bound on scrapes in flight when several URLs are given
+MAX_CONCURRENT_SCRAPES = 8
+
+# How long `serve stop` waits for the daemon to exit. Longer than its own
+# worst-case shutdown: up to 10s SIGTERM + 5s SIGKILL waiting on Chrome, then
+# closing Playwright and the servers
+DAEMON_STOP_TIMEOUT = 30
+
+# The run's single daemon auto-start attempt, shared by all its web URLs so
+# concurrent scrapes don't each spawn a daemon (reset by run_scrapes)
+_daemon_start: asyncio.Task | None = None
+
+
+async def _start_daemon_announced() -> bool:
+    """Start the daemon in the background, reporting progress on stderr."""
+    print("Starting daemon...", file=sys.stderr)
+    if await start_daemon_background():
+        print("Daemon started", file=sys.stderr)
+        return True
+    print(
+        "Warning: Failed to start daemon, falling back to direct scraping",
+        file=sys.stderr,
+    )
+    return False
+
+
+async def _ensure_daemon_started(socket_path: Path):
+    """Start the daemon unless it's running, at most once per run.
+
+    Later callers wait on the first attempt instead of starting their own, and
+    a failed attempt isn't retried.
+
+    Args:
+        socket_path: Daemon socket to check
+    """
+    global _daemon_start
+
+    if _daemon_start is None:
+        if is_daemon_running(socket_path):
+            return
+        _daemon_start = asyncio.create_task(_start_daemon_announced())
+
+    # Shielded so a cancelled scrape doesn't abort the start others wait on
+    await asyncio.shield(_daemon_start)
+
 
 async def scrape_url(url: str) -> str:
     """Scrape a URL and return markdown content.
@@ -37,15 +82,7 @@ async def scrape_url(url: str) -> str:
         config = get_config()
 
         # Start daemon if not running
-        if not is_daemon_running(config.socket_path):
-            print("Starting daemon...", file=sys.stderr)
-            if start_daemon_background():
-                print("Daemon started", file=sys.stderr)
-            else:
-                print(
-                    "Warning: Failed to start daemon, falling back to direct scraping",
-                    file=sys.stderr,
-                )
+        await _ensure_daemon_started(config.socket_path)
 
         # Try to use daemon if available
         if is_daemon_running(config.socket_path):
@@ -60,21 +97,98 @@ async def scrape_url(url: str) -> str:
         # Fall back to direct scraping
         return await scrape_web(url)
 
-    # Direct scraping for YouTube and PDF
+    # Direct scraping for YouTube and PDF (blocking, so run in a thread)
     if url_type == "youtube":
-        return scrape_youtube(url)
+        return await asyncio.to_thread(scrape_youtube, url)
     elif url_type == "pdf":
-        return scrape_pdf(url)
+        # Imported here so non-PDF runs (and the daemon's worker processes,
+        # which re-import the entry script) don't load docling
+        from scrape_to_md.pdf import scrape_pdf
+
+        return await asyncio.to_thread(scrape_pdf, url)
     else:
         # Shouldn't reach here, but handle gracefully
         return await scrape_web(url)
 
 
-def start_daemon_background():
+async def run_scrapes(urls: list[str]) -> int:
+    """Scrape URLs concurrently and print each result to stdout in input order.
+
+    Results are printed as soon as they and all earlier URLs are done. PDFs
+    are converted together in one docling batch. The idle daemon connections
+    and the shared fallback browser are closed afterwards.
+
+    Args:
+        urls: URLs to scrape
+
+    Returns:
+        Number of URLs that failed
+    """
+    global _daemon_start
+
+    _daemon_start = None
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+    async def scrape_bounded(url: str) -> str:
+        async with semaphore:
+            return await scrape_url(url)
+
+    pdf_urls = [url for url in urls if detect_url_type(url) == "pdf"]
+    pdf_batch = None
+    if len(pdf_urls) > 1:
+        from scrape_to_md.pdf import scrape_pdfs
+
+        pdf_batch = asyncio.create_task(asyncio.to_thread(scrape_pdfs, pdf_urls))
+
+    async def pdf_from_batch(url: str) -> str:
+        result = (await pdf_batch)[pdf_urls.index(url)]
+        if isinstance(result, RuntimeError):
+            raise result
+        return result
+
+    tasks = [
+        asyncio.create_task(
+            pdf_from_batch(url) if pdf_batch and url in pdf_urls else scrape_bounded(url)
+        )
+        for url in urls
+    ]
+    failures = 0
+
+    try:
+        for url, task in zip(urls, tasks, strict=True):
+            # Only name the URL in errors when there is more than one
+            label = f"{url}: " if len(urls) > 1 else ""
+            try:
+                content = await task
+            except RuntimeError as e:
+                print(f"Error: {label}{e}", file=sys.stderr)
+                failures += 1
+            except Exception as e:
+                print(f"Unexpected error: {label}{e}", file=sys.stderr)
+                failures += 1
+            else:
+                # A large result written to a slow pipe would otherwise stall
+                # the scrapes still in flight
+                await asyncio.to_thread(print, content)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if pdf_batch:
+            pdf_batch.cancel()
+        if _daemon_start:
+            _daemon_start.cancel()
+            _daemon_start = None
+        await close_connections()
+        await shutdown_browser()
+
+    return failures
+
+
+async def start_daemon_background():
     """Start daemon in background.
 
     Returns:
-        True if daemon was started, False if already running
+        True if daemon was started, False if already running or it failed to start
     """
     config = get_config()
 
@@ -83,21 +197,23 @@ def start_daemon_background():
         return False
 
     # Start daemon in background
-    subprocess.Popen(
+    process = subprocess.Popen(
         [sys.executable, "-m", "scrape_to_md.chrome_service"],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
         start_new_session=True,
     )
 
-    # Wait for daemon to be ready (up to 5 seconds)
-    for _ in range(50):
-        time.sleep(0.1)
-        if is_daemon_running(config.socket_path):
-            return True
-
-    # Daemon didn't start in time
-    return False
+    # Wait for daemon to be ready (up to 5 seconds), bailing out if it exits
+    socket_path = str(config.socket_path)
+    try:
+        return await wait_until_ready(
+            lambda: asyncio.open_unix_connection(socket_path),
+            process.pid,
+            timeout=5,
+        )
+    except RuntimeError:
+        return False
 
 
 def handle_serve_start():
@@ -118,7 +234,21 @@ def handle_serve_stop():
 
     try:
         pid = int(pid_file.read_text())
-        os.kill(pid, signal.SIGTERM)
+        if hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(pid)
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+                # Pidfd becomes readable once the daemon (and its cleanup) is done
+                if not select.select([pidfd], [], [], DAEMON_STOP_TIMEOUT)[0]:
+                    print(
+                        f"Daemon (PID {pid}) did not exit within {DAEMON_STOP_TIMEOUT} seconds",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+            finally:
+                os.close(pidfd)
+        else:
+            os.kill(pid, signal.SIGTERM)
         print(f"Stopped daemon (PID {pid})")
     except ProcessLookupError:
         print("Daemon process not found, cleaning up stale PID file")
@@ -176,6 +306,9 @@ daemon:
 
   # Unix socket path for daemon communication
   socket_path: ~/.local/share/scrape_to_md/chrome_scraper.sock
+
+  # Launch Chrome with memory-saving flags (disables GPU, limits renderers)
+  chrome_low_memory: false
 """
 
     # Write config file
@@ -223,6 +356,7 @@ Examples:
   scrape_to_md https://example.com/article > output.md
   scrape_to_md https://youtube.com/watch?v=abc123
   scrape_to_md https://example.com/document.pdf
+  scrape_to_md https://example.com/a https://example.com/b > both.md
 
 Setup:
   scrape_to_md init               # Create default config file
@@ -239,16 +373,16 @@ Config file: ~/.config/scrape_to_md/config.yml
   Run 'scrape_to_md init' to create a default config file.
         """,
     )
-    parser.add_argument("url", help="URL to scrape")
+    parser.add_argument(
+        "url", nargs="+", help="URL(s) to scrape; multiple URLs are scraped concurrently"
+    )
 
     args = parser.parse_args()
 
     try:
-        markdown = asyncio.run(scrape_url(args.url))
-        print(markdown)
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        failures = asyncio.run(run_scrapes(args.url))
+        if failures:
+            sys.exit(1)
     except KeyboardInterrupt:
         print("\nInterrupted", file=sys.stderr)
         sys.exit(130)
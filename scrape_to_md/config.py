@@ -1,14 +1,60 @@
 """Configuration management for scrape_to_md."""
 
+import os
 import platform
 import sys
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
 
+@cache
+def _find_chrome(system: str) -> str:
+    """Find Chrome executable for a platform (cached after the first hit).
+
+    Args:
+        system: Platform name as returned by platform.system()
+
+    Returns:
+        Path to Chrome executable
+
+    Raises:
+        RuntimeError: If Chrome executable cannot be found
+    """
+    if system == "Darwin":  # macOS
+        paths = [
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            "/Applications/Chromium.app/Contents/MacOS/Chromium",
+        ]
+    elif system == "Linux":
+        paths = [
+            "/usr/bin/google-chrome",
+            "/usr/bin/google-chrome-stable",
+            "/usr/bin/chromium",
+            "/usr/bin/chromium-browser",
+            "/snap/bin/chromium",
+        ]
+    elif system == "Windows":
+        paths = [
+            "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+            "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
+            "C:\\Program Files\\Chromium\\Application\\chrome.exe",
+        ]
+    else:
+        raise RuntimeError(f"Unsupported platform: {system}")
+
+    for path in paths:
+        if Path(path).exists():
+            return path
+
+    raise RuntimeError(
+        f"Chrome executable not found. Searched paths: {', '.join(paths)}"
+    )
+
+
 @dataclass
 class Config:
     """Application configuration."""
@@ -18,51 +64,53 @@ class Config:
     chrome_profile: Path
     socket_path: Path
     cdp_port: int
+    chrome_low_memory: bool = False
+
+    @property
+    def scrape_socket_path(self) -> Path:
+        """Unix socket for framed scrape requests, alongside socket_path.
+
+        socket_path keeps serving HTTP (health checks and JSON scrapes for
+        HTTP clients); the CLI scrapes using the msgpack protocol in
+        scrape_to_md.protocol on this socket.
+        """
+        return self.socket_path.with_suffix(".msgpack.sock")
 
     def find_chrome_executable(self) -> str:
         """Find Chrome executable based on platform.
 
+        The search result is cached, so repeated Chrome relaunches don't
+        re-stat every candidate path.
+
         Returns:
             Path to Chrome executable
 
         Raises:
             RuntimeError: If Chrome executable cannot be found
         """
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chromium.app/Contents/MacOS/Chromium",
-            ]
-        elif system == "Linux":
-            paths = [
-                "/usr/bin/google-chrome",
-                "/usr/bin/google-chrome-stable",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-                "/snap/bin/chromium",
-            ]
-        elif system == "Windows":
-            paths = [
-                "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-                "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
-                "C:\\Program Files\\Chromium\\Application\\chrome.exe",
-            ]
-        else:
-            raise RuntimeError(f"Unsupported platform: {system}")
-
-        for path in paths:
-            if Path(path).exists():
-                return path
-
-        raise RuntimeError(
-            f"Chrome executable not found. Searched paths: {', '.join(paths)}"
-        )
+        return _find_chrome(platform.system())
 
 
 _config_instance: Optional[Config] = None
 
+# libyaml-backed loader when available, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _load_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file, cached until its modification time changes.
+
+    Args:
+        path: Path to YAML file
+        mtime_ns: File modification time, used as the cache key
+
+    Returns:
+        Parsed YAML data (empty dict for an empty file)
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 def get_config() -> Config:
     """Get application configuration (singleton).
@@ -90,18 +138,30 @@ def get_config() -> Config:
         "chrome_profile": str(data_dir / "chrome_profile"),
         "socket_path": str(data_dir / "chrome_scraper.sock"),
         "cdp_port": 9222,
+        "chrome_low_memory": False,
     }
 
     # Load from config file if it exists
-    if config_file.exists():
+    try:
+        config_mtime = os.stat(config_file).st_mtime_ns
+    except OSError:
+        config_mtime = None
+
+    if config_mtime is not None:
         try:
-            with open(config_file, "r") as f:
-                user_config = yaml.safe_load(f) or {}
+            user_config = _load_yaml(str(config_file), config_mtime)
 
             # Handle daemon-specific config
             if "daemon" in user_config and isinstance(user_config["daemon"], dict):
                 daemon_config = user_config["daemon"]
-                for key in ["logs_dir", "pids_dir", "chrome_profile", "socket_path", "cdp_port"]:
+                for key in [
+                    "logs_dir",
+                    "pids_dir",
+                    "chrome_profile",
+                    "socket_path",
+                    "cdp_port",
+                    "chrome_low_memory",
+                ]:
                     if key in daemon_config:
                         config_data[key] = daemon_config[key]
         except Exception as e:
@@ -114,6 +174,7 @@ def get_config() -> Config:
         chrome_profile=Path(config_data["chrome_profile"]).expanduser(),
         socket_path=Path(config_data["socket_path"]).expanduser(),
         cdp_port=int(config_data["cdp_port"]),
+        chrome_low_memory=bool(config_data["chrome_low_memory"]),
     )
 
     return _config_instance
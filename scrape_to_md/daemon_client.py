@@ -1,10 +1,20 @@
 """Client for communicating with the Chrome daemon service."""
 
+import asyncio
+import contextlib
 import socket
 from pathlib import Path
 
-import aiohttp
-import yaml
+from scrape_to_md.frontmatter import render_frontmatter
+from scrape_to_md.protocol import encode_frame, read_frame
+
+# Idle daemon connections, reused so repeated scrapes in one process don't
+# reconnect for every request
+_IDLE_CONNECTIONS: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+MAX_IDLE_CONNECTIONS = 16
+
+# Total time allowed for one scrape request
+REQUEST_TIMEOUT = 60
 
 
 def is_daemon_running(socket_path: Path) -> bool:
@@ -16,18 +26,79 @@ def is_daemon_running(socket_path: Path) -> bool:
     Returns:
         True if daemon is running and accepting connections
     """
-    if not socket_path.exists():
-        return False
-
+    # A missing socket file fails the connect with ENOENT, so no separate stat
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        # Try to connect to the socket
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        sock.connect(str(socket_path))
-        sock.close()
-        return True
-    except (socket.error, OSError):
+        sock.settimeout(0.2)
+        return sock.connect_ex(str(socket_path)) == 0
+    except OSError:
+        # e.g. path too long for AF_UNIX
         return False
+    finally:
+        sock.close()
+
+
+async def _request(message: dict) -> dict:
+    """Send one framed request to the daemon and return its response.
+
+    Uses an idle connection when one is available. Idle connections that turn
+    out to be dead (e.g. daemon restarted) are discarded and the request moves
+    on to the next one, ending with a fresh connection. The daemon answers
+    scrape failures with an error frame, so only a broken connection leads to
+    a resend.
+
+    Args:
+        message: Request map
+
+    Returns:
+        Response map
+
+    Raises:
+        OSError: If the daemon socket cannot be reached
+        asyncio.IncompleteReadError: If the daemon closes the connection
+    """
+    from scrape_to_md.config import get_config
+
+    frame = encode_frame(message)
+
+    while True:
+        reused = bool(_IDLE_CONNECTIONS)
+        if reused:
+            reader, writer = _IDLE_CONNECTIONS.pop()
+        else:
+            config = get_config()
+            reader, writer = await asyncio.open_unix_connection(
+                str(config.scrape_socket_path)
+            )
+
+        try:
+            writer.write(frame)
+            await writer.drain()
+            response = await read_frame(reader)
+        except (OSError, asyncio.IncompleteReadError):
+            writer.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            # Timeout or cancellation mid-request: connection state is unknown
+            writer.close()
+            raise
+
+        if len(_IDLE_CONNECTIONS) < MAX_IDLE_CONNECTIONS:
+            _IDLE_CONNECTIONS.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+
+async def close_connections():
+    """Close idle daemon connections."""
+    while _IDLE_CONNECTIONS:
+        _, writer = _IDLE_CONNECTIONS.pop()
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
 
 
 async def scrape_via_daemon(url: str) -> str:
@@ -42,27 +113,12 @@ async def scrape_via_daemon(url: str) -> str:
     Raises:
         RuntimeError: If daemon request fails
     """
-    from scrape_to_md.config import get_config
-
-    config = get_config()
-
-    # Connect to Unix socket using aiohttp UnixConnector
-    connector = aiohttp.UnixConnector(path=str(config.socket_path))
-
     try:
-        async with aiohttp.ClientSession(connector=connector) as session:
-            # POST to /scrape endpoint
-            async with session.post(
-                "http://localhost/scrape",
-                json={"url": url, "selector": None},
-                timeout=aiohttp.ClientTimeout(total=60),
-            ) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(
-                        f"Daemon returned status {resp.status}: {await resp.text()}"
-                    )
-                result = await resp.json()
-    except aiohttp.ClientError as e:
+        async with asyncio.timeout(REQUEST_TIMEOUT):
+            result = await _request({"url": url, "selector": None})
+    except TimeoutError:
+        raise RuntimeError(f"Daemon did not respond within {REQUEST_TIMEOUT} seconds")
+    except (OSError, asyncio.IncompleteReadError, ValueError) as e:
         raise RuntimeError(f"Failed to connect to daemon: {e}")
 
     # Check for errors in response
@@ -80,11 +136,7 @@ async def scrape_via_daemon(url: str) -> str:
         'source': 'web',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-    content = f"""---
-{yaml_frontmatter}---
-
+    content = f"""{render_frontmatter(frontmatter)}
 {markdown}
 """
 
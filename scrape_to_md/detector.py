@@ -1,6 +1,16 @@
 """URL type detection."""
 import re
-from urllib.parse import urlparse
+
+# Scheme and network location, matched atomically so a PDF-looking host
+# (e.g. "https://files.pdf") can't be re-read as a path
+_PREFIX = r"(?>(?:[a-z][a-z0-9+.\-]*:)?(?://[^/?#]*)?)"
+
+# YouTube host anywhere in the network location
+_YOUTUBE = re.compile(r"(?:[a-z][a-z0-9+.\-]*:)?//[^/?#]*(?:youtube\.com|youtu\.be)", re.I)
+
+# Path (not query or fragment) ending in .pdf, optionally with ;params on the
+# last segment
+_PDF = re.compile(_PREFIX + r"[^?#]*\.pdf(?:;[^/?#]*)?(?:[?#]|$)", re.I)
 
 
 def detect_url_type(url: str) -> str:
@@ -12,16 +22,12 @@ def detect_url_type(url: str) -> str:
     Returns:
         One of: 'youtube', 'pdf', 'web'
     """
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
-    path = parsed.path.lower()
-
     # YouTube detection
-    if 'youtube.com' in domain or 'youtu.be' in domain:
+    if _YOUTUBE.match(url):
         return 'youtube'
 
     # PDF detection
-    if path.endswith('.pdf'):
+    if _PDF.match(url):
         return 'pdf'
 
     # Everything else uses web scraping (Chrome + trafilatura)
@@ -0,0 +1,31 @@
+"""Trafilatura extraction run in the daemon's worker processes.
+
+Kept apart from chrome_service so that unpickling the worker function in a
+spawned process imports only trafilatura, not aiohttp or Playwright.
+"""
+import trafilatura
+
+
+def extract_markdown(html: str) -> str:
+    """Extract markdown from HTML with trafilatura.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Extracted markdown, or empty string if nothing was extracted
+    """
+    # Parse once; extract() works on a copy, so both passes share the tree
+    tree = trafilatura.load_html(html)
+    if tree is None:
+        return ""
+
+    options = {"include_links": True, "include_images": True, "output_format": "markdown"}
+
+    # trafilatura's own algorithm only (fast mode) first; the slower
+    # readability/justext fallbacks run only if that finds nothing
+    return (
+        trafilatura.extract(tree, fast=True, **options)
+        or trafilatura.extract(tree, **options)
+        or ""
+    )
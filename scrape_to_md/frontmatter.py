@@ -0,0 +1,29 @@
+"""YAML frontmatter rendering shared by all scrapers."""
+import json
+
+# Characters json.dumps leaves raw that YAML either rejects (DEL, C1 controls)
+# or treats as line breaks inside a quoted scalar (NEL, LS, PS)
+_YAML_UNSAFE = {
+    c: f"\\u{c:04x}" for c in (0x7F, *range(0x80, 0xA0), 0x2028, 0x2029)
+}
+
+
+def render_frontmatter(fields: dict[str, str]) -> str:
+    """Render fields as a YAML frontmatter block.
+
+    Each value is written as a JSON string, which is also a valid YAML
+    double-quoted scalar, so titles with quotes, colons or newlines round-trip
+    without going through the YAML serializer.
+
+    Args:
+        fields: Frontmatter keys and string values, in output order
+
+    Returns:
+        Frontmatter including the ``---`` delimiters and a trailing newline
+    """
+    lines = ["---"]
+    for key, value in fields.items():
+        quoted = json.dumps(value, ensure_ascii=False).translate(_YAML_UNSAFE)
+        lines.append(f"{key}: {quoted}")
+    lines.append("---\n")
+    return "\n".join(lines)
@@ -0,0 +1,10 @@
+"""Connection pool shared by the scrapers that fetch over plain HTTP."""
+import urllib3
+
+# Pooled connections, so repeated requests to a host skip the TCP/TLS setup.
+# One retry for connection/read failures keeps an unreachable host from
+# delaying the browser fallback; redirects get their own budget, as with urllib
+POOL = urllib3.PoolManager(
+    maxsize=16,
+    retries=urllib3.Retry(total=None, connect=1, read=1, redirect=10, other=0),
+)
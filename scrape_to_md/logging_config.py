@@ -1,13 +1,25 @@
 """Logging configuration for scrape_to_md."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+_FILE_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)s: %(message)s")
+
+# Logger names setup_logging has already configured
+_CONFIGURED: set[str] = set()
+
 
 def setup_logging(name: str, log_file: Path) -> logging.Logger:
     """Setup logging with file and console handlers.
 
+    The logger itself only enqueues records; a background QueueListener thread
+    does the formatting, disk writes and rotation, so logging from the event
+    loop never blocks on file IO.
+
     Args:
         name: Logger name (typically __name__)
         log_file: Path to log file
@@ -15,12 +27,17 @@ def setup_logging(name: str, log_file: Path) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    # Repeat calls skip setLevel and the handler check, which take logging's lock
+    if name in _CONFIGURED:
+        return logging.getLogger(name)
+
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
     # Avoid adding handlers multiple times
     if logger.handlers:
+        _CONFIGURED.add(name)
         return logger
 
     # Ensure log directory exists
@@ -33,19 +50,22 @@ def setup_logging(name: str, log_file: Path) -> logging.Logger:
         backupCount=5,
     )
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_FILE_FORMATTER)
 
     # Console handler - INFO level
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter("%(levelname)s: %(message)s")
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+
+    # Hand records to a listener thread that owns both handlers
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    _CONFIGURED.add(name)
 
     return logger
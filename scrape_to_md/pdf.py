@@ -1,56 +1,167 @@
 """PDF scraper using docling."""
+import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import urlretrieve
 
-import yaml
+from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.document_converter import DocumentConverter
 
+from scrape_to_md.frontmatter import render_frontmatter
+from scrape_to_md.http_pool import POOL
 
-def scrape_pdf(url: str) -> str:
-    """Scrape PDF and convert to markdown.
+# Parallel downloads per scrape_pdfs batch (network-bound, so threads suffice)
+MAX_CONCURRENT_DOWNLOADS = 8
 
-    Args:
-        url: PDF URL
+# Converter shared across calls so docling's models load once per process.
+# The lock also serializes conversions, which share the converter's pipeline.
+_converter: DocumentConverter | None = None
+_docling_lock = threading.Lock()
 
-    Returns:
-        Markdown content with frontmatter
+# Conversion statuses whose document is usable (matches convert()'s default)
+_CONVERTED = {ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS}
 
-    Raises:
-        RuntimeError: If scraping fails
+
+def _get_converter() -> DocumentConverter:
+    """Get the shared converter, loading the PDF pipeline's models on first use.
+
+    Returns:
+        DocumentConverter with its PDF pipeline initialized
     """
-    # Download PDF to temp file
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    global _converter
+
+    with _docling_lock:
+        if _converter is None:
+            converter = DocumentConverter()
+            converter.initialize_pipeline(InputFormat.PDF)
+            _converter = converter
+        return _converter
 
-    try:
-        urlretrieve(url, tmp_path)
-    except Exception as e:
-        raise RuntimeError(f"Failed to download PDF: {e}")
 
-    # Convert with docling
+def _download(url: str, path: Path):
+    """Stream a URL to a file using the shared connection pool.
+
+    Args:
+        url: URL to download
+        path: Destination file
+
+    Raises:
+        RuntimeError: If the server responds with an error status
+        urllib3.exceptions.HTTPError: If the request fails
+    """
+    resp = POOL.request('GET', url, preload_content=False)
     try:
-        converter = DocumentConverter()
-        result = converter.convert(str(tmp_path))
-        markdown_content = result.document.export_to_markdown()
-    except Exception as e:
-        tmp_path.unlink(missing_ok=True)
-        raise RuntimeError(f"Failed to convert PDF: {e}")
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(resp, f)
     finally:
-        tmp_path.unlink(missing_ok=True)
+        resp.release_conn()
+
 
+def _render(url: str, markdown_content: str) -> str:
+    """Add frontmatter to converted PDF markdown."""
     # Add properly escaped YAML frontmatter
     frontmatter = {
         'url': url,
         'source': 'PDF',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-    content = f"""---
-{yaml_frontmatter}---
-
+    content = f"""{render_frontmatter(frontmatter)}
 {markdown_content}
 """
 
     return content
+
+
+def scrape_pdfs(urls: list[str]) -> list[str | RuntimeError]:
+    """Scrape several PDFs, converting them in one docling batch.
+
+    Args:
+        urls: PDF URLs
+
+    Returns:
+        For each URL, in order: markdown content with frontmatter, or the
+        RuntimeError that prevented scraping it
+    """
+    results: list[str | RuntimeError | None] = [None] * len(urls)
+
+    # Download PDFs to temp files
+    tmp_paths = []
+    for _ in urls:
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+            tmp_paths.append(Path(tmp.name))
+
+    try:
+        # Load docling's models while the PDFs download in parallel
+        warmup = ThreadPoolExecutor(max_workers=1)
+        try:
+            converter_future = warmup.submit(_get_converter)
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as downloads:
+                download_futures = [
+                    downloads.submit(_download, url, tmp_path)
+                    for url, tmp_path in zip(urls, tmp_paths, strict=True)
+                ]
+                for i, future in enumerate(download_futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        results[i] = RuntimeError(f"Failed to download PDF: {e}")
+        finally:
+            # Don't block on the models here: conversion waits for them if any
+            # download succeeded, and otherwise they aren't needed
+            warmup.shutdown(wait=False, cancel_futures=True)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        # Convert with docling; results are matched back by temp file name
+        remaining = {tmp_paths[i].name: i for i in pending}
+        try:
+            converter = converter_future.result()
+            with _docling_lock:
+                # Export each document as docling yields it, so only one
+                # converted document is held in memory at a time
+                for res in converter.convert_all(
+                    [str(tmp_paths[i]) for i in pending], raises_on_error=False
+                ):
+                    i = remaining.pop(res.input.file.name)
+                    if res.status not in _CONVERTED:
+                        results[i] = RuntimeError(f"Failed to convert PDF: {res.status.value}")
+                        continue
+                    try:
+                        results[i] = _render(urls[i], res.document.export_to_markdown())
+                    except Exception as e:
+                        results[i] = RuntimeError(f"Failed to convert PDF: {e}")
+        except Exception as e:
+            for i in remaining.values():
+                results[i] = RuntimeError(f"Failed to convert PDF: {e}")
+            return results
+
+        for i in remaining.values():
+            results[i] = RuntimeError("Failed to convert PDF: no result")
+
+        return results
+    finally:
+        for tmp_path in tmp_paths:
+            tmp_path.unlink(missing_ok=True)
+
+
+def scrape_pdf(url: str) -> str:
+    """Scrape PDF and convert to markdown.
+
+    Args:
+        url: PDF URL
+
+    Returns:
+        Markdown content with frontmatter
+
+    Raises:
+        RuntimeError: If scraping fails
+    """
+    (result,) = scrape_pdfs([url])
+    if isinstance(result, RuntimeError):
+        raise result
+    return result
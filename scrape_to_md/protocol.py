@@ -0,0 +1,50 @@
+"""Length-prefixed msgpack framing for the daemon's scrape socket.
+
+Each frame is a 4-byte big-endian body length followed by a msgpack-encoded
+map. Requests are ``{"url": ..., "selector": ...}``; responses are the dict
+returned by ``ChromeService.scrape``. A connection carries any number of
+request/response pairs in sequence.
+"""
+
+import asyncio
+import struct
+
+import msgpack
+
+_HEADER = struct.Struct(">I")
+
+# Refuse frames larger than this rather than allocating unbounded buffers
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+def encode_frame(message: dict) -> bytes:
+    """Encode a message as a length-prefixed frame.
+
+    Args:
+        message: Map of msgpack-serializable values
+
+    Returns:
+        Frame bytes ready to write to the socket
+    """
+    body = msgpack.packb(message)
+    return _HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict:
+    """Read and decode one frame.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Decoded message
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closes the connection mid-frame
+            (or before sending one)
+        ValueError: If the frame exceeds MAX_FRAME_SIZE
+    """
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {length} bytes exceeds limit of {MAX_FRAME_SIZE}")
+    return msgpack.unpackb(await reader.readexactly(length))
@@ -0,0 +1,159 @@
+"""Event-driven waits on processes we spawn (Chrome, the daemon)."""
+
+import asyncio
+import os
+import select
+from collections.abc import Awaitable, Callable
+
+
+def _watch_exit(loop: asyncio.AbstractEventLoop, pid: int) -> tuple[asyncio.Future, Callable]:
+    """Watch a process for exit without polling.
+
+    Uses a pidfd on Linux and kqueue EVFILT_PROC on macOS/BSD. On platforms
+    with neither, the returned future never resolves and callers rely on
+    their timeout alone.
+
+    Args:
+        loop: Running event loop
+        pid: Process ID to watch
+
+    Returns:
+        Tuple of (future resolved when the process exits, cleanup callable)
+    """
+    exited = loop.create_future()
+
+    def on_exit():
+        if not exited.done():
+            exited.set_result(None)
+
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            on_exit()
+            return exited, lambda: None
+        except OSError:
+            # Kernel < 5.3 or seccomp-restricted: fall back to timeout only
+            return exited, lambda: None
+
+        loop.add_reader(pidfd, on_exit)
+
+        def cleanup():
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+        return exited, cleanup
+
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            kq.control(
+                [
+                    select.kevent(
+                        pid,
+                        filter=select.KQ_FILTER_PROC,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                        fflags=select.KQ_NOTE_EXIT,
+                    )
+                ],
+                0,
+                0,
+            )
+        except ProcessLookupError:
+            kq.close()
+            on_exit()
+            return exited, lambda: None
+
+        loop.add_reader(kq.fileno(), on_exit)
+
+        def cleanup():
+            loop.remove_reader(kq.fileno())
+            kq.close()
+
+        return exited, cleanup
+
+    return exited, lambda: None
+
+
+async def _connect_until_accepted(connect: Callable[[], Awaitable], interval: float):
+    """Retry connect() until it succeeds, then close the probe connection."""
+    while True:
+        try:
+            _, writer = await connect()
+        except OSError:
+            await asyncio.sleep(interval)
+            continue
+        writer.close()
+        return
+
+
+async def wait_until_ready(
+    connect: Callable[[], Awaitable],
+    pid: int,
+    timeout: float,
+    interval: float = 0.1,
+) -> bool:
+    """Wait until a spawned process accepts connections.
+
+    Races connection attempts against an exit watcher on the process, so a
+    process that dies during startup is reported immediately instead of
+    after the full timeout.
+
+    Args:
+        connect: Coroutine function opening a connection, e.g.
+            ``lambda: asyncio.open_connection("127.0.0.1", port)``
+        pid: PID of the process being waited on
+        timeout: Maximum seconds to wait
+        interval: Delay between refused connection attempts
+
+    Returns:
+        True if the process accepted a connection, False on timeout
+
+    Raises:
+        RuntimeError: If the process exits before accepting connections
+    """
+    loop = asyncio.get_running_loop()
+    exited, unwatch = _watch_exit(loop, pid)
+    ready = asyncio.ensure_future(_connect_until_accepted(connect, interval))
+
+    try:
+        done, _ = await asyncio.wait(
+            {ready, exited}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        ready.cancel()
+        unwatch()
+
+    if ready in done:
+        ready.result()
+        return True
+    if exited in done:
+        raise RuntimeError(f"Process {pid} exited before accepting connections")
+    return False
+
+
+async def wait_for_exit(pidfd: int, timeout: float) -> bool:
+    """Wait for the process behind a pidfd to exit.
+
+    Args:
+        pidfd: File descriptor from os.pidfd_open()
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the process exited, False on timeout
+    """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+
+    def on_exit():
+        if not exited.done():
+            exited.set_result(None)
+
+    loop.add_reader(pidfd, on_exit)
+    try:
+        await asyncio.wait_for(exited, timeout)
+        return True
+    except TimeoutError:
+        return False
+    finally:
+        loop.remove_reader(pidfd)
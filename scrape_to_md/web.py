@@ -1,53 +1,195 @@
 """Web scraper using Playwright + trafilatura."""
-import yaml
+import asyncio
+import contextlib
+
 import trafilatura
-from playwright.async_api import async_playwright
+import urllib3
+from lxml.html import HtmlElement
+from playwright.async_api import Browser, Playwright, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from scrape_to_md.frontmatter import render_frontmatter
+from scrape_to_md.http_pool import POOL
+
+# Headless browser shared by all scrape_web calls in this process
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+_browser_lock = asyncio.Lock()
+
+# Cap on waiting for the load event after DOMContentLoaded; slow subresources
+# past this point rarely change the text trafilatura extracts
+LOAD_STATE_TIMEOUT_MS = 5000
+
+# Plain HTTP fetch tried before the browser; server-rendered pages need nothing more
+STATIC_FETCH_TIMEOUT = urllib3.Timeout(connect=5, read=15)
+_STATIC_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/130.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8',
+}
+_HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Larger pages go to the browser rather than being buffered whole in memory
+MAX_STATIC_HTML_BYTES = 10 * 1024 * 1024
+
+# Less text than this without JavaScript suggests a client-rendered page or a
+# "please enable JavaScript" gate (React noscript shells, bot challenges)
+MIN_STATIC_CONTENT_CHARS = 200
+
+# Resource types trafilatura never sees; the HTML keeps their URLs, so image
+# links still make it into the markdown
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+async def _block_resources(route: Route):
+    """Abort requests for resources that don't affect extracted text."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def get_browser() -> Browser:
+    """Get the shared headless browser, launching it on first use.
+
+    Returns:
+        Connected Chromium browser
+    """
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+
+async def shutdown_browser():
+    """Close the shared browser and Playwright, if they were started."""
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
 
-async def scrape_web(url: str) -> str:
-    """Scrape web page using Chrome and extract main content with trafilatura.
+
+async def _fetch_page(url: str, javascript: bool) -> tuple[str, str]:
+    """Load a page in the shared browser.
 
     Args:
         url: Web page URL
+        javascript: Whether to run the page's scripts
 
     Returns:
-        Markdown content with frontmatter
+        Tuple of (HTML, title)
 
     Raises:
-        RuntimeError: If scraping fails
+        RuntimeError: If the page can't be loaded
     """
     try:
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        browser = await get_browser()
 
-            # Navigate to URL
-            await page.goto(url, wait_until='networkidle', timeout=30000)
+        # Fresh context per URL keeps scrapes isolated without a browser launch
+        context = await browser.new_context(java_script_enabled=javascript)
+        try:
+            await context.route('**/*', _block_resources)
+            page = await context.new_page()
 
-            # Get page content and title
-            html_content = await page.content()
-            title = await page.title()
+            # Navigate to URL; the DOM is usable well before the network is idle
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            with contextlib.suppress(PlaywrightTimeoutError):
+                await page.wait_for_load_state('load', timeout=LOAD_STATE_TIMEOUT_MS)
 
-            await browser.close()
+            # Get page content and title
+            return await page.content(), await page.title()
+        finally:
+            await context.close()
 
     except Exception as e:
         raise RuntimeError(f"Failed to fetch page with Playwright: {e}")
 
-    # Extract main content with trafilatura
+
+def _fetch_static(url: str) -> bytes | None:
+    """Fetch a page's HTML over plain HTTP, without a browser.
+
+    Args:
+        url: Web page URL
+
+    Returns:
+        Response body, or None if the request failed, didn't return HTML, or
+        the body exceeds MAX_STATIC_HTML_BYTES
+    """
+    try:
+        resp = POOL.request(
+            'GET', url, headers=_STATIC_HEADERS, timeout=STATIC_FETCH_TIMEOUT,
+            preload_content=False,
+        )
+    except urllib3.exceptions.HTTPError:
+        return None
+
+    try:
+        content_type = resp.headers.get('Content-Type', '').lower()
+        if resp.status == 200 and content_type.startswith(_HTML_TYPES):
+            body = resp.read(amt=MAX_STATIC_HTML_BYTES + 1)
+            if len(body) <= MAX_STATIC_HTML_BYTES:
+                return body
+        # Unread body left on the connection: close it rather than pool it
+        resp.close()
+        return None
+    except urllib3.exceptions.HTTPError:
+        return None
+    finally:
+        resp.release_conn()
+
+
+def _extract(tree: HtmlElement | None, url: str) -> str | None:
+    """Extract the main content of a page as markdown.
+
+    Args:
+        tree: Page parsed with trafilatura.load_html
+        url: Page URL, used to resolve relative links
+
+    Returns:
+        Extracted content, or None if nothing was found
+
+    Raises:
+        RuntimeError: If trafilatura fails
+    """
+    if tree is None:
+        return None
+
     try:
+        # Extract main content with trafilatura's own algorithm only (fast
+        # mode); extract() works on a copy, so every pass shares the tree
         extracted = trafilatura.extract(
-            html_content,
+            tree,
             output_format='markdown',
             include_links=True,
             include_images=True,
-            url=url
+            url=url,
+            fast=True,
         )
 
         if not extracted:
-            # Fallback to basic extraction
+            # Full markdown extraction, adding the slower readability/justext
+            # fallbacks, only if fast mode found nothing
+            extracted = trafilatura.extract(
+                tree,
+                output_format='markdown',
+                include_links=True,
+                include_images=True,
+                url=url,
+            )
+
+        if not extracted:
+            # Last resort: plain text, without formatting
             extracted = trafilatura.extract(
-                html_content,
+                tree,
                 output_format='txt',
                 url=url
             )
@@ -55,9 +197,16 @@ async def scrape_web(url: str) -> str:
     except Exception as e:
         raise RuntimeError(f"Failed to extract content with trafilatura: {e}")
 
-    if not extracted:
-        raise RuntimeError("No content could be extracted from the page")
+    return extracted or None
+
+
+def _is_thin(extracted: str | None) -> bool:
+    """Whether a JavaScript-free extraction is too short to be the page's content."""
+    return not extracted or len(extracted) < MIN_STATIC_CONTENT_CHARS
 
+
+def _render(url: str, title: str, extracted: str) -> str:
+    """Add frontmatter and a title heading to extracted content."""
     # Create markdown with properly escaped YAML frontmatter
     frontmatter = {
         'url': url,
@@ -65,14 +214,54 @@ async def scrape_web(url: str) -> str:
         'source': 'web',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-    content = f"""---
-{yaml_frontmatter}---
-
+    content = f"""{render_frontmatter(frontmatter)}
 # {title}
 
 {extracted}
 """
 
     return content
+
+
+async def scrape_web(url: str) -> str:
+    """Scrape web page using Chrome and extract main content with trafilatura.
+
+    Server-rendered pages are fetched over plain HTTP and never touch the
+    browser. Otherwise the page is loaded with JavaScript disabled, and only
+    if nothing can be extracted from that is it loaded again with JavaScript
+    enabled.
+
+    Args:
+        url: Web page URL
+
+    Returns:
+        Markdown content with frontmatter
+
+    Raises:
+        RuntimeError: If scraping fails
+    """
+    static_html = await asyncio.to_thread(_fetch_static, url)
+
+    if static_html is not None:
+        tree = trafilatura.load_html(static_html)
+        fallback = _extract(tree, url)
+        if not _is_thin(fallback):
+            # Collapse whitespace like document.title does
+            title = ' '.join((tree.findtext('.//title') or '').split())
+            return _render(url, title, fallback)
+    else:
+        # The plain fetch was refused or failed; a real browser may still get
+        # the server-rendered page
+        html_content, title = await _fetch_page(url, javascript=False)
+        fallback = _extract(trafilatura.load_html(html_content), url)
+        if not _is_thin(fallback):
+            return _render(url, title, fallback)
+
+    # Client-rendered or gated page: the content only exists once scripts have run
+    html_content, title = await _fetch_page(url, javascript=True)
+    extracted = _extract(trafilatura.load_html(html_content), url) or fallback
+
+    if not extracted:
+        raise RuntimeError("No content could be extracted from the page")
+
+    return _render(url, title, extracted)
@@ -1,72 +1,93 @@
 """YouTube scraper using yt-dlp and transcript API."""
-import json
-import subprocess
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import yaml
+import yt_dlp
 from youtube_transcript_api import YouTubeTranscriptApi
 
+from scrape_to_md.frontmatter import render_frontmatter
 
-def extract_video_id(url: str) -> str:
-    """Extract YouTube video ID from URL.
+# YoutubeDL instances aren't thread-safe, so keep one per thread (metadata
+# fetches run on pool threads)
+_ydl_local = threading.local()
 
-    Args:
-        url: YouTube URL
+# Runs yt-dlp metadata fetches alongside the transcript fetch
+_METADATA_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yt-metadata")
 
-    Returns:
-        Video ID
+# Video ID in youtu.be/<id>, watch?v=<id>, /embed/<id> or /shorts/<id> URLs
+_VIDEO_ID = re.compile(r"(?:youtu\.be/|[?&]v=|/embed/|/shorts/)([A-Za-z0-9_-]{6,})")
 
-    Raises:
-        ValueError: If video ID cannot be extracted
-    """
-    # Handle youtu.be format
-    if 'youtu.be/' in url:
-        return url.split('youtu.be/')[-1].split('?')[0].split('&')[0]
 
-    # Handle youtube.com format
-    if 'v=' in url:
-        return url.split('v=')[-1].split('&')[0]
+class _SilentLogger:
+    """yt-dlp logger that discards output (failures fall back to defaults)."""
 
-    raise ValueError(f"Could not extract video ID from URL: {url}")
+    def debug(self, msg):
+        pass
 
+    def warning(self, msg):
+        pass
 
-def scrape_youtube(url: str) -> str:
-    """Scrape YouTube video transcript and metadata.
+    def error(self, msg):
+        pass
+
+
+def _get_ydl() -> yt_dlp.YoutubeDL:
+    """Get this thread's metadata-only YoutubeDL instance, creating it on first use."""
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL({
+            'skip_download': True,
+            'quiet': True,
+            'no_warnings': True,
+            'logger': _SilentLogger(),
+            # Only the watch page metadata is needed: don't expand playlists
+            # from &list= or fetch the DASH/HLS format manifests
+            'noplaylist': True,
+            'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
+        })
+        _ydl_local.ydl = ydl
+    return ydl
+
+
+def extract_video_id(url: str) -> str:
+    """Extract YouTube video ID from URL.
 
     Args:
         url: YouTube URL
 
     Returns:
-        Markdown content with frontmatter
+        Video ID
 
     Raises:
-        RuntimeError: If scraping fails
+        ValueError: If video ID cannot be extracted
     """
-    try:
-        video_id = extract_video_id(url)
-    except ValueError as e:
-        raise RuntimeError(str(e))
+    match = _VIDEO_ID.search(url)
+    if match:
+        return match.group(1)
+
+    raise ValueError(f"Could not extract video ID from URL: {url}")
+
 
-    # Try to get transcript using the new API
-    transcript_text = None
+def _fetch_transcript(video_id: str) -> str | None:
+    """Fetch the English transcript as plain text, or None if unavailable."""
     try:
         api = YouTubeTranscriptApi()
         transcript = api.fetch(video_id, languages=('en',))
         # Extract text from snippets
         if hasattr(transcript, 'snippets') and transcript.snippets:
-            transcript_text = '\n'.join([snippet.text for snippet in transcript.snippets])
+            return '\n'.join([snippet.text for snippet in transcript.snippets])
     except Exception:
         # If transcript fails, we'll just leave it as None
         pass
+    return None
 
-    # Get video metadata using JSON output (more reliable than individual flags)
+
+def _fetch_metadata(url: str, video_id: str) -> tuple[str, str, str, str]:
+    """Fetch title, description, duration and upload date, with fallbacks on failure."""
+    # Get video metadata in-process (same fields as `yt-dlp -j`)
     try:
-        result = subprocess.run(
-            ['yt-dlp', '-j', '--skip-download', url],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        metadata = json.loads(result.stdout)
+        metadata = _get_ydl().extract_info(url, download=False)
         title = metadata.get('title', video_id)
         description = metadata.get('description', '')
         # Format duration as "MM:SS" or "HH:MM:SS"
@@ -82,13 +103,38 @@ def scrape_youtube(url: str) -> str:
         else:
             duration = ''
         upload_date = metadata.get('upload_date', '')
-    except Exception as e:
+    except Exception:
         # If yt-dlp fails, use fallback values
         title = video_id
         description = ''
         duration = ''
         upload_date = ''
 
+    return title, description, duration, upload_date
+
+
+def scrape_youtube(url: str) -> str:
+    """Scrape YouTube video transcript and metadata.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        Markdown content with frontmatter
+
+    Raises:
+        RuntimeError: If scraping fails
+    """
+    try:
+        video_id = extract_video_id(url)
+    except ValueError as e:
+        raise RuntimeError(str(e))
+
+    # Metadata and transcript are independent requests, so fetch them together
+    metadata_future = _METADATA_POOL.submit(_fetch_metadata, url, video_id)
+    transcript_text = _fetch_transcript(video_id)
+    title, description, duration, upload_date = metadata_future.result()
+
     # Create markdown content with properly escaped YAML frontmatter
     frontmatter = {
         'url': url,
@@ -99,11 +145,7 @@ def scrape_youtube(url: str) -> str:
         'upload_date': upload_date,
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-    content = f"""---
-{yaml_frontmatter}---
-
+    content = f"""{render_frontmatter(frontmatter)}
 # {title}
 
 **URL**: {url}
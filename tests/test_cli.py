@@ -0,0 +1,39 @@
+"""Tests for the CLI's batch scraping."""
+
+import asyncio
+
+from scrape_to_md import cli
+
+
+class TestRunScrapes:
+    """Test run_scrapes."""
+
+    async def test_daemon_started_once(self, monkeypatch, capsys):
+        """Test that web URLs share one failed daemon start and print in input order."""
+        starts = 0
+
+        async def failing_start():
+            nonlocal starts
+            starts += 1
+            await asyncio.sleep(0.05)
+            return False
+
+        async def scrape_web(url):
+            # Later URLs finish first
+            await asyncio.sleep(0.01 * (10 - int(url[-1])))
+            return f"content {url}"
+
+        async def noop():
+            pass
+
+        monkeypatch.setattr(cli, "start_daemon_background", failing_start)
+        monkeypatch.setattr(cli, "is_daemon_running", lambda socket_path: False)
+        monkeypatch.setattr(cli, "scrape_web", scrape_web)
+        monkeypatch.setattr(cli, "close_connections", noop)
+        monkeypatch.setattr(cli, "shutdown_browser", noop)
+
+        urls = [f"https://example.com/page{i}" for i in range(6)]
+        assert await cli.run_scrapes(urls) == 0
+
+        assert starts == 1
+        assert capsys.readouterr().out.splitlines() == [f"content {url}" for url in urls]
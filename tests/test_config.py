@@ -45,6 +45,7 @@ class TestConfig:
         assert config.pids_dir.name == "pids"
         assert config.chrome_profile.name == "chrome_profile"
         assert config.socket_path.name == "chrome_scraper.sock"
+        assert config.chrome_low_memory is False
 
         # Reset singleton
         scrape_to_md.config._config_instance = None
@@ -63,6 +64,7 @@ daemon:
   cdp_port: 9223
   chrome_profile: /custom/profile
   logs_dir: /custom/logs
+  chrome_low_memory: true
 """)
 
         try:
@@ -83,9 +85,37 @@ daemon:
             assert config.cdp_port == 9223
             assert str(config.chrome_profile) == "/custom/profile"
             assert str(config.logs_dir) == "/custom/logs"
+            assert config.chrome_low_memory is True
 
         finally:
             # Cleanup
             Path.home = original_home
             config_path.unlink()
             scrape_to_md.config._config_instance = None
+
+
+class TestLoadYaml:
+    """Test cached YAML loading."""
+
+    def test_reparses_when_mtime_changes(self, tmp_path):
+        """Test that the cache is keyed on modification time."""
+        from scrape_to_md.config import _load_yaml
+
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("daemon:\n  cdp_port: 9223\n")
+
+        first = _load_yaml(str(config_file), 1)
+        assert first == {"daemon": {"cdp_port": 9223}}
+
+        config_file.write_text("daemon:\n  cdp_port: 9224\n")
+        assert _load_yaml(str(config_file), 1) is first
+        assert _load_yaml(str(config_file), 2) == {"daemon": {"cdp_port": 9224}}
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file loads as an empty dict."""
+        from scrape_to_md.config import _load_yaml
+
+        config_file = tmp_path / "empty.yml"
+        config_file.write_text("")
+
+        assert _load_yaml(str(config_file), 0) == {}
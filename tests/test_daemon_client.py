@@ -0,0 +1,126 @@
+"""Tests for the daemon client."""
+
+import asyncio
+import logging
+import socket
+from pathlib import Path
+
+import pytest
+
+import scrape_to_md.config
+from scrape_to_md import chrome_service, daemon_client
+from scrape_to_md.config import Config
+from scrape_to_md.daemon_client import is_daemon_running
+from scrape_to_md.protocol import encode_frame, read_frame
+
+
+class TestIsDaemonRunning:
+    """Test daemon socket probe."""
+
+    def test_missing_socket(self, tmp_path):
+        """Test that a missing socket file reports not running."""
+        assert is_daemon_running(tmp_path / "missing.sock") is False
+
+    def test_listening_socket(self, tmp_path):
+        """Test that a listening socket reports running, and not after close."""
+        path = tmp_path / "d.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        server.listen()
+
+        try:
+            assert is_daemon_running(path) is True
+        finally:
+            server.close()
+
+        assert is_daemon_running(path) is False
+
+
+def _test_config(tmp_path: Path) -> Config:
+    """Build a config whose sockets live under tmp_path."""
+    return Config(
+        logs_dir=tmp_path / "logs",
+        pids_dir=tmp_path / "pids",
+        chrome_profile=tmp_path / "profile",
+        socket_path=tmp_path / "d.sock",
+        cdp_port=9222,
+    )
+
+
+class TestDaemonRequest:
+    """Test daemon client requests over a real Unix socket."""
+
+    async def test_connection_reused(self, tmp_path):
+        """Test that sequential requests share one connection."""
+        connections = 0
+
+        async def handle(reader, writer):
+            nonlocal connections
+            connections += 1
+            try:
+                while True:
+                    request = await read_frame(reader)
+                    writer.write(encode_frame({"echo": request["url"]}))
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        config = _test_config(tmp_path)
+        scrape_to_md.config._config_instance = config
+        server = await asyncio.start_unix_server(handle, path=str(config.scrape_socket_path))
+
+        try:
+            assert await daemon_client._request({"url": "a"}) == {"echo": "a"}
+            assert await daemon_client._request({"url": "b"}) == {"echo": "b"}
+            assert connections == 1
+        finally:
+            await daemon_client.close_connections()
+            server.close()
+            await server.wait_closed()
+            scrape_to_md.config._config_instance = None
+
+    async def test_scrape_failure_not_resent(self, tmp_path, monkeypatch):
+        """Test that a failing scrape comes back as an error and runs only once."""
+        calls = []
+
+        class FailingScraper:
+            async def scrape(self, url, selector=None):
+                calls.append(url)
+                if url == "bad":
+                    raise RuntimeError("No browser windows available")
+                return {"url": url, "title": "", "markdown": "ok", "error": None}
+
+        monkeypatch.setattr(chrome_service, "scraper", FailingScraper())
+        monkeypatch.setattr(chrome_service, "logger", logging.getLogger(__name__))
+
+        config = _test_config(tmp_path)
+        scrape_to_md.config._config_instance = config
+        server = await asyncio.start_unix_server(
+            chrome_service.handle_scrape_connection, path=str(config.scrape_socket_path)
+        )
+
+        try:
+            # Leave an idle connection behind that the failing request could be resent on
+            await daemon_client.scrape_via_daemon("good")
+
+            with pytest.raises(RuntimeError, match="Daemon scraping failed: No browser windows"):
+                await daemon_client.scrape_via_daemon("bad")
+
+            assert calls == ["good", "bad"]
+        finally:
+            await daemon_client.close_connections()
+            server.close()
+            await server.wait_closed()
+            scrape_to_md.config._config_instance = None
+
+    def test_scrape_socket_path(self):
+        """Test that the scrape socket sits next to the HTTP socket."""
+        config = Config(
+            logs_dir=Path("/tmp/logs"),
+            pids_dir=Path("/tmp/pids"),
+            chrome_profile=Path("/tmp/profile"),
+            socket_path=Path("/tmp/chrome_scraper.sock"),
+            cdp_port=9222,
+        )
+
+        assert config.scrape_socket_path == Path("/tmp/chrome_scraper.msgpack.sock")
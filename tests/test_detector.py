@@ -47,3 +47,20 @@ class TestDetectUrlType:
 
         # PDF in query string (not extension)
         assert detect_url_type("https://example.com?file=doc.pdf") == "web"
+
+        # YouTube in path or query, not host
+        assert detect_url_type("https://example.com/youtube.com/watch") == "web"
+        assert detect_url_type("https://example.com/?ref=youtu.be") == "web"
+
+        # PDF extension with query string or fragment
+        assert detect_url_type("https://example.com/doc.pdf?dl=1") == "pdf"
+        assert detect_url_type("https://example.com/doc.pdf#page=2") == "pdf"
+
+        # PDF extension with path parameters
+        assert detect_url_type("https://example.com/doc.pdf;jsessionid=ABC") == "pdf"
+        assert detect_url_type("https://example.com/doc.pdf;jsessionid=ABC?dl=1") == "pdf"
+        assert detect_url_type("https://example.com/doc.pdf;v=1/page") == "web"
+
+        # PDF-looking host with no path
+        assert detect_url_type("https://files.pdf") == "web"
+        assert detect_url_type("https://files.pdf/") == "web"
@@ -2,11 +2,18 @@
 
 import yaml
 
+from scrape_to_md.frontmatter import render_frontmatter
+
+
+def _parse(frontmatter: str) -> dict:
+    """Parse a rendered frontmatter block back with PyYAML."""
+    assert frontmatter.startswith("---\n")
+    assert frontmatter.endswith("\n---\n")
+    return yaml.safe_load(frontmatter[len("---\n"):-len("---\n")])
+
 
 def test_youtube_frontmatter_with_special_chars():
     """Test that YouTube frontmatter handles special YAML characters."""
-    import yaml
-
     # Simulate what youtube.py does with a problematic title
     url = "https://youtube.com/watch?v=test123"
     title = 'Test: "Title" with \'quotes\' & special chars'
@@ -14,7 +21,6 @@ def test_youtube_frontmatter_with_special_chars():
     duration = "300"
     upload_date = "20240101"
 
-    # This is what the code now does
     frontmatter = {
         'url': url,
         'title': title,
@@ -24,36 +30,31 @@ def test_youtube_frontmatter_with_special_chars():
         'upload_date': upload_date,
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
     # This should not raise an exception - validates proper YAML escaping
-    parsed = yaml.safe_load(yaml_frontmatter)
+    parsed = _parse(render_frontmatter(frontmatter))
 
     # Verify the title was properly escaped and parsed
     assert parsed['title'] == title
     assert ':' in parsed['title'] or '"' in parsed['title'] or "'" in parsed['title']
 
+    # Numeric-looking strings must stay strings
+    assert parsed['duration'] == duration
+    assert parsed['upload_date'] == upload_date
+
 
 def test_web_frontmatter_with_special_chars():
     """Test that web frontmatter handles special YAML characters."""
-    # We'll test the frontmatter generation logic directly
-    import yaml
-
-    # Simulate what web.py does
     url = "https://example.com"
     title = 'Article: "How to use Claude" & more - Part 1'
 
-    # This is what the code now does
     frontmatter = {
         'url': url,
         'title': title,
         'source': 'web',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
     # This should not raise an exception
-    parsed = yaml.safe_load(yaml_frontmatter)
+    parsed = _parse(render_frontmatter(frontmatter))
 
     # Verify the title was properly escaped and parsed
     assert parsed['title'] == title
@@ -63,9 +64,6 @@ def test_web_frontmatter_with_special_chars():
 
 def test_pdf_frontmatter_with_special_chars():
     """Test that PDF frontmatter handles special URL characters."""
-    import yaml
-
-    # Simulate what pdf.py does
     url = "https://example.com/document?name=test&file=doc.pdf"
 
     frontmatter = {
@@ -73,10 +71,8 @@ def test_pdf_frontmatter_with_special_chars():
         'source': 'PDF',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
     # This should not raise an exception
-    parsed = yaml.safe_load(yaml_frontmatter)
+    parsed = _parse(render_frontmatter(frontmatter))
 
     assert parsed['url'] == url
     assert parsed['source'] == 'PDF'
@@ -84,9 +80,6 @@ def test_pdf_frontmatter_with_special_chars():
 
 def test_daemon_client_frontmatter_with_special_chars():
     """Test that daemon client frontmatter handles special characters."""
-    import yaml
-
-    # Simulate what daemon_client.py does
     url = "https://example.com/article"
     title = "Breaking: Company's \"New Product\" Launch - Q1 2024"
 
@@ -96,10 +89,8 @@ def test_daemon_client_frontmatter_with_special_chars():
         'source': 'web',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
     # This should not raise an exception
-    parsed = yaml.safe_load(yaml_frontmatter)
+    parsed = _parse(render_frontmatter(frontmatter))
 
     assert parsed['title'] == title
     assert parsed['url'] == url
@@ -107,8 +98,6 @@ def test_daemon_client_frontmatter_with_special_chars():
 
 def test_multiline_title():
     """Test that multiline titles are properly escaped."""
-    import yaml
-
     title = "Line 1\nLine 2\nLine 3"
 
     frontmatter = {
@@ -117,10 +106,26 @@ def test_multiline_title():
         'source': 'web',
     }
 
-    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
     # This should not raise an exception
-    parsed = yaml.safe_load(yaml_frontmatter)
+    parsed = _parse(render_frontmatter(frontmatter))
 
     # YAML should preserve the newlines
     assert parsed['title'] == title
+
+
+def test_unicode_and_control_characters():
+    """Test that unicode stays readable and YAML-unsafe characters are escaped."""
+    title = "Café — 日本語 #1\x7f\x85  \x00\ttab"
+
+    rendered = render_frontmatter({'title': title})
+    parsed = _parse(rendered)
+
+    assert parsed['title'] == title
+    assert "Café — 日本語" in rendered
+
+
+def test_key_order_preserved():
+    """Test that keys are emitted in insertion order."""
+    rendered = render_frontmatter({'url': 'u', 'title': 't', 'source': 's'})
+
+    assert rendered == '---\nurl: "u"\ntitle: "t"\nsource: "s"\n---\n'
@@ -0,0 +1,32 @@
+"""Tests for logging configuration."""
+
+import time
+from logging.handlers import QueueHandler
+
+from scrape_to_md.logging_config import setup_logging
+
+
+class TestSetupLogging:
+    """Test setup_logging."""
+
+    def test_handlers_added_once(self, tmp_path):
+        """Test that repeat calls return the same logger without duplicate queue handlers."""
+        log_file = tmp_path / "logs" / "test.log"
+
+        first = setup_logging("scrape_to_md.tests.once", log_file)
+        second = setup_logging("scrape_to_md.tests.once", log_file)
+
+        assert first is second
+        assert len(first.handlers) == 1
+        assert isinstance(first.handlers[0], QueueHandler)
+
+    def test_writes_to_log_file(self, tmp_path):
+        """Test that queued records reach the log file from the listener thread."""
+        log_file = tmp_path / "logs" / "test.log"
+        logger = setup_logging("scrape_to_md.tests.file", log_file)
+
+        logger.debug("hello from the test")
+        deadline = time.monotonic() + 5
+        while "hello from the test" not in log_file.read_text():
+            assert time.monotonic() < deadline, "record never written"
+            time.sleep(0.01)
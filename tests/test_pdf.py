@@ -0,0 +1,148 @@
+"""Tests for batched PDF scraping."""
+
+import enum
+import http.server
+import sys
+import threading
+import time
+import types
+from pathlib import Path, PurePath
+
+import pytest
+
+try:
+    import docling  # noqa: F401
+except ImportError:
+    # Minimal stand-in for the docling names pdf.py imports; the converter
+    # itself is replaced in every test
+    class _ConversionStatus(enum.Enum):
+        SUCCESS = "success"
+        PARTIAL_SUCCESS = "partial_success"
+        FAILURE = "failure"
+
+    class _InputFormat(enum.Enum):
+        PDF = "pdf"
+
+    for _name in (
+        "docling", "docling.datamodel", "docling.datamodel.base_models",
+        "docling.document_converter",
+    ):
+        sys.modules[_name] = types.ModuleType(_name)
+    sys.modules["docling.datamodel.base_models"].ConversionStatus = _ConversionStatus
+    sys.modules["docling.datamodel.base_models"].InputFormat = _InputFormat
+    sys.modules["docling.document_converter"].DocumentConverter = object
+
+from scrape_to_md import pdf  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """Serve /<name>.pdf with the body '%PDF <name>'; /missing.pdf is 404."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/missing.pdf":
+                self.send_error(404)
+                return
+            data = f"%PDF {self.path.strip('/').removesuffix('.pdf')}".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class FakeConverter:
+    """Converter that reads the downloaded file back as the document's markdown.
+
+    Results are yielded in reverse input order so callers must match them by
+    file name. Files whose body contains "bad" fail to convert, and those
+    containing "lost" produce no result at all.
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    def convert_all(self, paths, raises_on_error):
+        self.batches.append(list(paths))
+        for path in reversed(paths):
+            body = Path(path).read_text()
+            if "lost" in body:
+                continue
+            status = (
+                pdf.ConversionStatus.FAILURE if "bad" in body else pdf.ConversionStatus.SUCCESS
+            )
+            yield types.SimpleNamespace(
+                input=types.SimpleNamespace(file=PurePath(path)),
+                status=status,
+                document=types.SimpleNamespace(export_to_markdown=lambda body=body: body),
+            )
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    """Use a FakeConverter in place of docling's."""
+    fake = FakeConverter()
+    monkeypatch.setattr(pdf, "_get_converter", lambda: fake)
+    return fake
+
+
+class TestScrapePdfs:
+    """Test scrape_pdfs."""
+
+    def test_results_in_input_order(self, server, converter):
+        """Test that results are matched to their URLs despite out-of-order conversion."""
+        urls = [f"{server}/{name}.pdf" for name in ("one", "two", "three")]
+
+        results = pdf.scrape_pdfs(urls)
+
+        assert len(converter.batches) == 1
+        for url, name, result in zip(urls, ("one", "two", "three"), results, strict=True):
+            assert f'url: "{url}"' in result
+            assert f"%PDF {name}" in result
+
+    def test_per_url_failures(self, server, converter):
+        """Test that download, conversion and missing-result failures stay with their URL."""
+        urls = [f"{server}/{name}.pdf" for name in ("good", "missing", "bad", "lost")]
+
+        good, missing, bad, lost = pdf.scrape_pdfs(urls)
+
+        assert "%PDF good" in good
+        assert isinstance(missing, RuntimeError)
+        assert "Failed to download PDF" in str(missing)
+        assert isinstance(bad, RuntimeError)
+        assert str(bad) == "Failed to convert PDF: failure"
+        assert isinstance(lost, RuntimeError)
+        assert str(lost) == "Failed to convert PDF: no result"
+
+        # The failed download is never handed to docling
+        assert len(converter.batches[0]) == 3
+
+    def test_all_downloads_failed_skips_model_wait(self, server, monkeypatch):
+        """Test that failed downloads return without waiting for docling's models."""
+        loaded = threading.Event()
+
+        def slow_converter():
+            loaded.wait(5)
+            return FakeConverter()
+
+        monkeypatch.setattr(pdf, "_get_converter", slow_converter)
+
+        started = time.monotonic()
+        try:
+            results = pdf.scrape_pdfs([f"{server}/missing.pdf"])
+        finally:
+            loaded.set()
+
+        assert time.monotonic() - started < 2
+        assert isinstance(results[0], RuntimeError)
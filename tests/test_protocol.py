@@ -0,0 +1,41 @@
+"""Tests for the daemon's framed scrape protocol."""
+
+import asyncio
+import struct
+
+import pytest
+
+from scrape_to_md.protocol import MAX_FRAME_SIZE, encode_frame, read_frame
+
+
+def _reader_for(data: bytes) -> asyncio.StreamReader:
+    """Build a StreamReader pre-filled with data."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestFraming:
+    """Test frame encoding and decoding."""
+
+    async def test_round_trip(self):
+        """Test that consecutive frames decode to the original messages."""
+        first = {"url": "https://example.com", "selector": None}
+        second = {"url": "https://example.com/2", "markdown": "# Title\n\nüñíçødé"}
+        reader = _reader_for(encode_frame(first) + encode_frame(second))
+
+        assert await read_frame(reader) == first
+        assert await read_frame(reader) == second
+
+    async def test_closed_connection(self):
+        """Test that EOF before a frame raises IncompleteReadError."""
+        with pytest.raises(asyncio.IncompleteReadError):
+            await read_frame(_reader_for(b""))
+
+    async def test_oversized_frame_rejected(self):
+        """Test that a frame over the size limit is refused."""
+        reader = _reader_for(struct.pack(">I", MAX_FRAME_SIZE + 1))
+
+        with pytest.raises(ValueError):
+            await read_frame(reader)
@@ -0,0 +1,93 @@
+"""Tests for process readiness and exit waits."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from scrape_to_md.readiness import wait_for_exit, wait_until_ready
+
+
+def _refuse():
+    """Connection factory that always fails like a closed port."""
+
+    async def connect():
+        raise ConnectionRefusedError
+
+    return connect
+
+
+class TestWaitUntilReady:
+    """Test wait_until_ready."""
+
+    async def test_ready_when_port_accepts(self):
+        """Test returning True once the server accepts connections."""
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+
+        try:
+            ready = await wait_until_ready(
+                lambda: asyncio.open_connection("127.0.0.1", port),
+                process.pid,
+                timeout=5,
+            )
+            assert ready is True
+        finally:
+            process.kill()
+            process.wait()
+            server.close()
+            await server.wait_closed()
+
+    async def test_timeout_returns_false(self):
+        """Test returning False when the process never accepts connections."""
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+
+        try:
+            assert await wait_until_ready(_refuse(), process.pid, timeout=0.3) is False
+        finally:
+            process.kill()
+            process.wait()
+
+    async def test_exited_process_fails_fast(self):
+        """Test that a process dying during startup is reported before the timeout."""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(RuntimeError, match="exited"):
+            await wait_until_ready(_refuse(), process.pid, timeout=10)
+        assert loop.time() - started < 5
+
+        process.wait()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd requires Linux")
+class TestWaitForExit:
+    """Test wait_for_exit."""
+
+    async def test_exit_detected(self):
+        """Test returning True once the process exits."""
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        pidfd = os.pidfd_open(process.pid)
+
+        try:
+            process.terminate()
+            assert await wait_for_exit(pidfd, timeout=5) is True
+        finally:
+            os.close(pidfd)
+            process.wait()
+
+    async def test_timeout_returns_false(self):
+        """Test returning False while the process is still running."""
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        pidfd = os.pidfd_open(process.pid)
+
+        try:
+            assert await wait_for_exit(pidfd, timeout=0.2) is False
+        finally:
+            os.close(pidfd)
+            process.kill()
+            process.wait()
@@ -0,0 +1,130 @@
+"""Tests for the web scraper's fetch chain."""
+
+import http.server
+import threading
+
+import pytest
+
+from scrape_to_md import web
+
+ARTICLE = (
+    "<html><head><title>\n  Static Article\n  | Example\n</title></head><body>"
+    "<article><h1>Static Article</h1><p>"
+    + "Server-rendered paragraph text with enough words to extract. " * 10
+    + "</p></article></body></html>"
+)
+RENDERED = ARTICLE.replace("Static Article", "Rendered Article").replace(
+    "Server-rendered", "Client-rendered"
+)
+SHELL = (
+    "<html><head><title>App</title></head><body>"
+    "<noscript>You need to enable JavaScript to run this app.</noscript>"
+    "<div id='root'></div></body></html>"
+)
+EMPTY = "<html><head><title>App</title></head><body><div id='root'></div></body></html>"
+
+
+@pytest.fixture
+def site():
+    """Serve fixed HTML pages from a local HTTP server; unknown paths are 404."""
+    pages = {"/article": ARTICLE, "/shell": SHELL}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    """Replace the Playwright fetch; returns the javascript flag of each call.
+
+    Set ``browser.pages[javascript]`` to the HTML the fake browser returns.
+    """
+
+    class FakeBrowser(list):
+        pages = {False: SHELL, True: RENDERED}
+
+    calls = FakeBrowser()
+
+    async def fetch_page(url, javascript):
+        calls.append(javascript)
+        return calls.pages[javascript], "Browser Title"
+
+    monkeypatch.setattr(web, "_fetch_page", fetch_page)
+    return calls
+
+
+class TestScrapeWeb:
+    """Test scrape_web's static fetch and browser fallbacks."""
+
+    async def test_static_page_skips_browser(self, site, browser):
+        """Test that a server-rendered page is extracted without the browser."""
+        content = await web.scrape_web(f"{site}/article")
+
+        assert browser == []
+        assert 'title: "Static Article | Example"' in content
+        assert "\n# Static Article | Example\n" in content
+        assert "Server-rendered paragraph" in content
+
+    async def test_thin_static_page_goes_to_javascript(self, site, browser):
+        """Test that a JavaScript shell from the plain fetch is loaded with JavaScript."""
+        content = await web.scrape_web(f"{site}/shell")
+
+        assert browser == [True]
+        assert "Client-rendered paragraph" in content
+
+    async def test_failed_fetch_tries_browser_without_then_with_javascript(
+        self, site, browser
+    ):
+        """Test that a failed plain fetch falls back to the no-JS, then the JS browser load."""
+        content = await web.scrape_web(f"{site}/missing")
+
+        assert browser == [False, True]
+        assert "Client-rendered paragraph" in content
+
+    async def test_failed_fetch_accepts_substantial_no_js_page(self, site, browser):
+        """Test that the no-JS browser load is used when it has enough content."""
+        browser.pages = {False: ARTICLE, True: RENDERED}
+
+        content = await web.scrape_web(f"{site}/missing")
+
+        assert browser == [False]
+        assert "Server-rendered paragraph" in content
+
+    async def test_thin_result_is_last_resort(self, site, browser):
+        """Test that thin static content is returned when the JS load finds nothing."""
+        browser.pages = {False: EMPTY, True: EMPTY}
+
+        content = await web.scrape_web(f"{site}/shell")
+
+        assert browser == [True]
+        assert "enable JavaScript" in content
+
+    async def test_oversized_page_goes_to_browser(self, site, browser, monkeypatch):
+        """Test that a body over the size cap isn't used from the plain fetch."""
+        monkeypatch.setattr(web, "MAX_STATIC_HTML_BYTES", 100)
+        browser.pages = {False: ARTICLE, True: RENDERED}
+
+        await web.scrape_web(f"{site}/article")
+
+        assert browser == [False]
@@ -33,6 +33,18 @@ class TestExtractVideoId:
         url = "https://m.youtube.com/watch?v=dQw4w9WgXcQ"
         assert extract_video_id(url) == "dQw4w9WgXcQ"
 
+    def test_embed_and_shorts_urls(self):
+        """Test embed and shorts URL paths."""
+        embed = "https://www.youtube.com/embed/dQw4w9WgXcQ"
+        shorts = "https://youtube.com/shorts/dQw4w9WgXcQ?feature=share"
+        assert extract_video_id(embed) == "dQw4w9WgXcQ"
+        assert extract_video_id(shorts) == "dQw4w9WgXcQ"
+
+    def test_v_param_not_first(self):
+        """Test v= after other query parameters, ignoring look-alike keys."""
+        url = "https://www.youtube.com/watch?feature=share&dev=1&v=dQw4w9WgXcQ"
+        assert extract_video_id(url) == "dQw4w9WgXcQ"
+
     def test_invalid_url(self):
         """Test invalid URL raises ValueError."""
         with pytest.raises(ValueError):